@@ -1,17 +1,34 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import matplotlib
+matplotlib.use("Agg")  # PNG output only, no GUI (also in chart worker processes)
 import matplotlib.pyplot as plt
-from datetime import date, timedelta
 import os
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import njit, prange  # optional, speeds up the IQR pass on big data
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
 
 
 # Settings
 
 DATA_FILE = "ANLT5060_StAnthony-VilaHealth.csv"
-ENRICHED_OUT = "vilahealth_stanthony_enriched.csv"
+ENRICHED_OUT = "vilahealth_stanthony_enriched.parquet"
+ENRICHED_CSV_OUT = "vilahealth_stanthony_enriched.csv"
+SAVE_ENRICHED_CSV = False  # also write the enriched data as CSV
 MISSING_OUT = "missingness_summary.csv"
 NUMERIC_OUT = "numeric_summary_iqr.csv"
 SHOW_TOP_N_CAT = 12  # top categories for bar charts
+NUMBA_MIN_ROWS = 100_000  # use the numba IQR kernel at or above this many rows
+PLOT_WORKERS = None  # processes for chart rendering (None = one per CPU)
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
 
 # helper functions
@@ -20,6 +37,10 @@ def print_header(title):
     print("\n" + title)
     print("=" * len(title))
 
+def write_csv(frame, filename):
+    # pyarrow's multi-threaded C++ CSV writer
+    pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), filename)
+
 def save_bar(series, title, filename, xlabel="", ylabel=""):
     plt.figure()
     series.plot(kind="bar", rot=45)
@@ -32,9 +53,10 @@ def save_bar(series, title, filename, xlabel="", ylabel=""):
     plt.savefig(filename)
     plt.close()
 
-def save_hist(series, title, filename, bins=20, xlabel="Value", ylabel="Frequency"):
+def save_hist(arr, title, filename, bins=20, rng=None, xlabel="Value", ylabel="Frequency"):
+    # arr: float ndarray without NaN; rng: (min, max) if already known
     plt.figure()
-    plt.hist(series.dropna(), bins=bins)
+    plt.hist(arr, bins=bins, range=rng)
     plt.title(title)
     plt.xlabel(xlabel)
     plt.ylabel(ylabel)
@@ -42,277 +64,323 @@ def save_hist(series, title, filename, bins=20, xlabel="Value", ylabel="Frequenc
     plt.savefig(filename)
     plt.close()
 
-def save_box(series, title, filename, ylabel="Value"):
+def save_box(arr, title, filename, ylabel="Value"):
+    # arr: float ndarray without NaN
     plt.figure()
-    plt.boxplot(series.dropna().values, vert=True)
+    plt.boxplot(arr, vert=True)
     plt.title(title)
     plt.ylabel(ylabel)
     plt.tight_layout()
     plt.savefig(filename)
     plt.close()
 
-# --- holiday functions 
-def nth_weekday_of_month(y, m, weekday, n):
-    # weekday: Mon=0..Sun=6
-    d = date(y, m, 1)
-    # move forward to the first `weekday`
-    while d.weekday() != weekday:
-        d = date(d.year, d.month, d.day + 1)
-    # then add 7 days (n-1) times
-    for _ in range(n - 1):
-        d = date(d.year, d.month, d.day + 7)
-    return d
-
-def last_weekday_of_month(y, m, weekday):
-    # weekday: Mon=0..Sun=6
-    if m == 12:
-        last = date(y, 12, 31)
-    else:
-        first_next = date(y, m + 1, 1)
-        last = first_next - timedelta(days=1)  # step back one day
-    while last.weekday() != weekday:
-        last = last - timedelta(days=1)
-    return last
-
-def build_us_holidays_for_year(y):
-    hol = set()
-    # fixed holidays
-    hol.add(date(y, 1, 1))    # New Year's Day
-    hol.add(date(y, 7, 4))    # Independence Day
-    hol.add(date(y, 11, 11))  # Veterans Day
-    hol.add(date(y, 12, 25))  # Christmas
-    # common Monday holidays
-    hol.add(nth_weekday_of_month(y, 1, 0, 3))   # MLK Day (3rd Mon of Jan)
-    hol.add(nth_weekday_of_month(y, 2, 0, 3))   # Presidents Day (3rd Mon of Feb)
-    hol.add(last_weekday_of_month(y, 5, 0))     # Memorial Day (last Mon of May)
-    hol.add(nth_weekday_of_month(y, 9, 0, 1))   # Labor Day (1st Mon of Sep)
-    hol.add(nth_weekday_of_month(y, 10, 0, 2))  # Indigenous Peoples/Columbus (2nd Mon of Oct)
-    # Thanksgiving
-    hol.add(nth_weekday_of_month(y, 11, 3, 4))  # 4th Thu of Nov
-    return hol
-
-
-# 1) Load and basic prep
-
-df = pd.read_csv(DATA_FILE)
-
-# make lowercase and underscores
-cols = []
-for c in df.columns:
-    c2 = c.strip().lower().replace(" ", "_")
-    cols.append(c2)
-df.columns = cols
-
-# find a date column by name
-date_col = None
-for c in df.columns:
-    if "date" in c:
-        date_col = c
-        break
-if date_col is None:
-    date_col = df.columns[0]
-
-# parse to datetime
-df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-
-# figure out types 
-char_cols = []
-num_cols = []
-for c in df.columns:
-    if pd.api.types.is_numeric_dtype(df[c]):
-        num_cols.append(c)
-    else:
-        char_cols.append(c)
-
-
-# 2) Profiling (using loops)
-
-# day of week name
-df["day_of_week"] = df[date_col].dt.day_name()
-
-# build a holiday calendar for each year in the data
-years = []
-for dval in df[date_col].dropna():
-    y = dval.year
-    if y not in years:
-        years.append(y)
-years = sorted(years)
-
-holiday_calendar = {}
-for y in years:
-    holiday_calendar[y] = build_us_holidays_for_year(y)
-
-# is_holiday flag (loop over rows)
-is_holiday_vals = []
-for i in range(len(df)):
-    dval = df.loc[i, date_col]
-    if pd.isna(dval):
-        is_holiday_vals.append(np.nan)
-    else:
-        the_date = dval.date()
-        y = dval.year
-        if y in holiday_calendar and the_date in holiday_calendar[y]:
-            is_holiday_vals.append(True)
-        else:
-            is_holiday_vals.append(False)
-df["is_holiday"] = is_holiday_vals
-
-# weekend flag
-df["is_weekend"] = df[date_col].dt.weekday >= 5
-
-
-# 3) Profiling
-
-# variable types table
-types_df = pd.DataFrame({
-    "variable": list(df.columns),
-    "dtype": [str(t) for t in df.dtypes]
-})
-
-# --- Show variable names and data types (for screenshot) ---
-print("\nVARIABLE NAMES AND TYPES")
-print("=" * len("VARIABLE NAMES AND TYPES"))
-print(types_df.to_string(index=False))
-
-# missingness
-missing_counts = df.isna().sum()
-missing = pd.DataFrame({
-    "missing_count": missing_counts
-})
-missing["missing_pct"] = (missing["missing_count"] / len(df) * 100).round(2)
-missing = missing.reset_index().rename(columns={"index": "column"})
-
-# character frequencies (include engineered)
-char_cols_full = []
-for c in char_cols:
-    if c not in char_cols_full:
-        char_cols_full.append(c)
-for c in ["day_of_week", "is_holiday", "is_weekend"]:
-    if c not in char_cols_full and c in df.columns:
-        char_cols_full.append(c)
-
-char_freqs = {}
-for c in char_cols_full:
-    if c in df.columns:
-        # convert to string, treat NaN as <NA>
-        ser = df[c].astype("string")
-        ser = ser.fillna("<NA>")
-        vc = ser.value_counts(dropna=False)
-        freq_df = pd.DataFrame({c: vc.index, "count": vc.values})
-        freq_df["pct"] = (freq_df["count"] / len(df) * 100).round(2)
-        char_freqs[c] = freq_df
-
-# numeric summary + IQR fences
-rows = []
-for c in num_cols:
-    s = df[c]
-    s = s.dropna().astype(float)
-    if len(s) == 0:
-        rows.append({
-            "variable": c, "count": 0, "mean": np.nan, "std": np.nan, "min": np.nan,
-            "q1": np.nan, "median": np.nan, "q3": np.nan, "max": np.nan,
-            "iqr": np.nan, "lower_fence": np.nan, "upper_fence": np.nan, "outlier_pct": np.nan
-        })
-    else:
-        q1 = s.quantile(0.25)
-        q3 = s.quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - 1.5 * iqr
-        upper = q3 + 1.5 * iqr
-        # compute outlier pct using whole column length (like original)
-        outlier_mask = (df[c] < lower) | (df[c] > upper)
-        outlier_pct = (outlier_mask.sum() / len(df)) * 100.0
-
-        rows.append({
-            "variable": c,
-            "count": int(s.count()),
-            "mean": round(float(s.mean()), 2),
-            "std": round(float(s.std()), 2),
-            "min": float(s.min()),
-            "q1": float(q1),
-            "median": float(s.median()),
-            "q3": float(q3),
-            "max": float(s.max()),
-            "iqr": float(iqr),
-            "lower_fence": float(lower),
-            "upper_fence": float(upper),
-            "outlier_pct": round(float(outlier_pct), 2)
-        })
-
-num_summary_df = pd.DataFrame(rows)
-
-
-# 4) Save outputs
-
-df.to_csv(ENRICHED_OUT, index=False)
-missing.to_csv(MISSING_OUT, index=False)
-num_summary_df.to_csv(NUMERIC_OUT, index=False)
-
-for c in char_freqs:
-    out_name = f"freq_{c}.csv"
-    char_freqs[c].to_csv(out_name, index=False)
-
-
-# 5) Print to terminal
-
-pd.set_option("display.max_rows", 999)
-pd.set_option("display.max_columns", 200)
-pd.set_option("display.width", 120)
-pd.set_option("display.max_colwidth", 60)
-
-print_header("VARIABLE NAMES AND TYPES")
-print(types_df.to_string(index=False))
-
-print_header("MISSING DATA SUMMARY")
-print(missing.to_string(index=False))
-
-# --- Summaries (short version) ---
-print("\nNUMERIC SUMMARY AND IQR OUTLIER FENCES (see CSV for full details)")
-print(num_summary_df.head(5).to_string(index=False))
-
-print("\nFREQUENCY TABLES (first few shown)")
-for c in char_freqs:
-    print(f"- {c}: {len(char_freqs[c])} categories")
-
-
-
-# 6) Charts (PNG files)
-
-# Missing percent bar
-miss_series = missing.set_index("column")["missing_pct"]
-save_bar(miss_series, "Percent Missing by Column", "missingness_bar.png", "Column", "Percent Missing")
-
-# Numeric hist + box
-for c in num_cols:
-    s = df[c].astype(float)
-    save_hist(s, f"Histogram - {c}", f"hist_{c}.png", bins=20, xlabel=c, ylabel="Frequency")
-    save_box(s, f"Boxplot - {c}", f"box_{c}.png", ylabel=c)
-
-# Character top-N bars
-for c in char_freqs:
-    t = char_freqs[c]
-    # sort by count desc
-    t_sorted = t.sort_values("count", ascending=False)
-    top_n = t_sorted.head(SHOW_TOP_N_CAT)
+# chart jobs (run in worker processes, one per column)
+def plot_numeric(arr, c, rng=None):
+    save_hist(arr, f"Histogram - {c}", f"hist_{c}.png", bins=20, rng=rng, xlabel=c, ylabel="Frequency")
+    save_box(arr, f"Boxplot - {c}", f"box_{c}.png", ylabel=c)
+
+def plot_top_n(t, c):
+    # tables are already sorted by count desc
+    top_n = t.head(SHOW_TOP_N_CAT)
     counts_series = top_n.set_index(c)["count"]
-    title = f"Top {min(SHOW_TOP_N_CAT, len(t_sorted))} Categories - {c}"
+    title = f"Top {len(top_n)} Categories - {c}"
     save_bar(counts_series, title, f"bar_{c}.png", xlabel=c, ylabel="Count")
 
+# --- holiday functions (vectorized over an array of years)
+def fixed_date(years, m, d):
+    parts = pd.DataFrame({"year": years, "month": m, "day": d})
+    return pd.DatetimeIndex(pd.to_datetime(parts))
 
-# 7) Files saved list
+def nth_weekday_of_month(years, m, weekday, n):
+    # weekday: Mon=0..Sun=6
+    first = fixed_date(years, m, 1)
+    # days forward to the first `weekday`, then (n-1) more weeks
+    shift = (weekday - first.dayofweek) % 7 + 7 * (n - 1)
+    return first + pd.to_timedelta(shift, unit="D")
+
+def last_weekday_of_month(years, m, weekday):
+    # weekday: Mon=0..Sun=6
+    first = fixed_date(years, m, 1)
+    last = first + pd.to_timedelta(first.days_in_month - 1, unit="D")
+    # step back to the last `weekday`
+    shift = (last.dayofweek - weekday) % 7
+    return last - pd.to_timedelta(shift, unit="D")
+
+def build_us_holidays(years):
+    years = np.asarray(years, dtype=int)
+    hol = [
+        # fixed holidays
+        fixed_date(years, 1, 1),    # New Year's Day
+        fixed_date(years, 7, 4),    # Independence Day
+        fixed_date(years, 11, 11),  # Veterans Day
+        fixed_date(years, 12, 25),  # Christmas
+        # common Monday holidays
+        nth_weekday_of_month(years, 1, 0, 3),   # MLK Day (3rd Mon of Jan)
+        nth_weekday_of_month(years, 2, 0, 3),   # Presidents Day (3rd Mon of Feb)
+        last_weekday_of_month(years, 5, 0),     # Memorial Day (last Mon of May)
+        nth_weekday_of_month(years, 9, 0, 1),   # Labor Day (1st Mon of Sep)
+        nth_weekday_of_month(years, 10, 0, 2),  # Indigenous Peoples/Columbus (2nd Mon of Oct)
+        # Thanksgiving
+        nth_weekday_of_month(years, 11, 3, 4),  # 4th Thu of Nov
+    ]
+    return pd.DatetimeIndex(np.concatenate([h.values for h in hol])).unique().sort_values()
+
+
+# --- IQR fence kernel (numba, parallel over columns)
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def quantile_sorted(vals, q):
+        # linear interpolation, same as np.percentile's default
+        pos = q * (len(vals) - 1)
+        i = int(np.floor(pos))
+        j = min(i + 1, len(vals) - 1)
+        return vals[i] + (vals[j] - vals[i]) * (pos - i)
+
+    @njit(parallel=True, cache=True)
+    def iqr_fences(arr):
+        n_cols = arr.shape[1]
+        q1 = np.full(n_cols, np.nan)
+        median = np.full(n_cols, np.nan)
+        q3 = np.full(n_cols, np.nan)
+        outlier_count = np.zeros(n_cols, dtype=np.int64)
+        for c in prange(n_cols):
+            col = arr[:, c]
+            vals = np.sort(col[~np.isnan(col)])
+            if len(vals) == 0:
+                continue
+            q1[c] = quantile_sorted(vals, 0.25)
+            median[c] = quantile_sorted(vals, 0.5)
+            q3[c] = quantile_sorted(vals, 0.75)
+            iqr = q3[c] - q1[c]
+            lower = q1[c] - 1.5 * iqr
+            upper = q3[c] + 1.5 * iqr
+            outlier_count[c] = np.sum((col < lower) | (col > upper))
+        return q1, median, q3, outlier_count
+
+
+def main():
+    # 1) Load and basic prep
+
+    # pyarrow engine: multi-threaded C++ parser
+    df = pd.read_csv(DATA_FILE, engine="pyarrow")
+
+    # make lowercase and underscores
+    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_", regex=False)
+
+    # find a date column by name
+    date_col = None
+    for c in df.columns:
+        if "date" in c:
+            date_col = c
+            break
+    if date_col is None:
+        date_col = df.columns[0]
+
+    # parse to datetime
+    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+
+    # figure out types (same split as is_numeric_dtype: numbers and bools, not timedeltas)
+    num_cols = df.select_dtypes(include=["number", "bool"], exclude="timedelta").columns.tolist()
+    char_cols = df.columns.drop(num_cols).tolist()
+
+
+    # 2) Profiling (vectorized)
+
+    dates = df[date_col]  # look the date column up once
+
+    # day of week name (categorical over Mon=0..Sun=6 codes, -1 for missing dates)
+    dow = dates.dt.dayofweek
+    df["day_of_week"] = pd.Categorical.from_codes(dow.fillna(-1).astype("int8"), categories=DAY_NAMES)
+
+    # build a holiday calendar for each year in the data
+    years = sorted(dates.dt.year.dropna().unique().astype(int).tolist())
+
+    # all holiday dates across the years, as one DatetimeIndex
+    all_hols = build_us_holidays(years)
+
+    # is_holiday flag (NaN where the date is missing),
+    # compared as int64 day numbers against the sorted holiday values
+    # (day resolution covers any year; the cast also floors to midnight)
+    hol_i8 = all_hols.to_numpy(dtype="datetime64[D]").view("i8")
+    dates_day_i8 = dates.to_numpy(dtype="datetime64[D]").view("i8")
+    is_hol = pd.Series(np.isin(dates_day_i8, hol_i8), index=df.index)
+    df["is_holiday"] = is_hol.where(dates.notna())
+
+    # weekend flag (reuses the day-of-week codes; NaN >= 5 is False, as before)
+    df["is_weekend"] = dow >= 5
+
+
+    # 3) Profiling
+
+    N = len(df)  # row count, used for all percentages below
+
+    # variable types table
+    types_df = pd.DataFrame({
+        "variable": list(df.columns),
+        "dtype": [str(t) for t in df.dtypes]
+    })
+
+    # missingness
+    missing_counts = N - df.count()
+    missing = pd.DataFrame({
+        "missing_count": missing_counts
+    })
+    missing["missing_pct"] = (missing["missing_count"] / N * 100).round(2)
+    missing = missing.reset_index().rename(columns={"index": "column"})
+
+    # character frequencies (include engineered)
+    char_cols_full = []
+    for c in char_cols:
+        if c not in char_cols_full:
+            char_cols_full.append(c)
+    for c in ["day_of_week", "is_holiday", "is_weekend"]:
+        if c not in char_cols_full and c in df.columns:
+            char_cols_full.append(c)
+
+    # one groupby over all character columns (as strings, NaN as <NA>)
+    freqs = (
+        df[char_cols_full].astype("string").fillna("<NA>")
+        .melt(var_name="_col", value_name="_val")
+        .groupby(["_col", "_val"], sort=False).size()
+        .rename("count").reset_index()
+        .sort_values("count", ascending=False, kind="stable")
+    )
+    freqs["pct"] = (freqs["count"] / N * 100).round(2)
+
+    char_freqs = {}
+    freq_groups = freqs.groupby("_col", sort=False)
+    for c in char_cols_full:
+        if c in freq_groups.groups:
+            freq_df = freq_groups.get_group(c).drop(columns="_col")
+            char_freqs[c] = freq_df.rename(columns={"_val": c}).reset_index(drop=True)
+
+    # numeric summary + IQR fences (all numeric columns at once)
+    arr = df[num_cols].to_numpy(dtype=float, na_value=np.nan)
+    count = np.count_nonzero(~np.isnan(arr), axis=0)
+    # numba starts its own thread pool here, so the chart pool below must spawn, not fork
+    use_numba = HAVE_NUMBA and N >= NUMBA_MIN_ROWS
+    with warnings.catch_warnings():
+        # all-NaN columns give NaN stats, same as before
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if use_numba:
+            q1, median, q3, outlier_count = iqr_fences(arr)
+        else:
+            q1, median, q3 = np.nanpercentile(arr, [25, 50, 75], axis=0)
+        mean = np.nanmean(arr, axis=0)
+        std = np.nanstd(arr, axis=0, ddof=1)
+        col_min = np.nanmin(arr, axis=0)
+        col_max = np.nanmax(arr, axis=0)
+    iqr = q3 - q1
+    lower = q1 - 1.5 * iqr
+    upper = q3 + 1.5 * iqr
+    # compute outlier pct using whole column length (like original)
+    if not use_numba:
+        outlier_count = ((arr < lower) | (arr > upper)).sum(axis=0)
+    outlier_pct = np.where(count > 0, outlier_count / max(N, 1) * 100.0, np.nan)
+
+    num_summary_df = pd.DataFrame({
+        "variable": num_cols,
+        "count": count,
+        "mean": np.round(mean, 2),
+        "std": np.round(std, 2),
+        "min": col_min,
+        "q1": q1,
+        "median": median,
+        "q3": q3,
+        "max": col_max,
+        "iqr": iqr,
+        "lower_fence": lower,
+        "upper_fence": upper,
+        "outlier_pct": np.round(outlier_pct, 2)
+    })
+
+
+    # 4) Save outputs
+
+    df.to_parquet(ENRICHED_OUT, engine="pyarrow", compression="zstd", index=False)
+    if SAVE_ENRICHED_CSV:
+        df.to_csv(ENRICHED_CSV_OUT, index=False)
+    write_csv(missing, MISSING_OUT)
+    write_csv(num_summary_df, NUMERIC_OUT)
+
+    for c in char_freqs:
+        out_name = f"freq_{c}.csv"
+        write_csv(char_freqs[c], out_name)
+
+
+    # 5) Print to terminal
+
+    pd.set_option("display.max_rows", 999)
+    pd.set_option("display.max_columns", 200)
+    pd.set_option("display.width", 120)
+    pd.set_option("display.max_colwidth", 60)
+
+    print_header("VARIABLE NAMES AND TYPES")
+    print(types_df.to_string(index=False))
+
+    print_header("MISSING DATA SUMMARY")
+    print(missing.to_string(index=False))
+
+    # --- Summaries (short version) ---
+    print("\nNUMERIC SUMMARY AND IQR OUTLIER FENCES (see CSV for full details)")
+    print(num_summary_df.head(5).to_string(index=False))
+
+    print("\nFREQUENCY TABLES (first few shown)")
+    for c in char_freqs:
+        print(f"- {c}: {len(char_freqs[c])} categories")
+
+
+
+    # 6) Charts (PNG files, rendered in parallel worker processes)
+
+    # spawn, not fork: forking after numba/arrow thread pools have started can deadlock
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=PLOT_WORKERS, mp_context=spawn) as ex:
+        jobs = []
+
+        # Missing percent bar
+        miss_series = missing.set_index("column")["missing_pct"]
+        jobs.append(ex.submit(save_bar, miss_series, "Percent Missing by Column", "missingness_bar.png",
+                              "Column", "Percent Missing"))
+
+        # Numeric hist + box (histogram range from the numeric summary)
+        num_ranges = num_summary_df.set_index("variable")[["min", "max"]]
+        for c in num_cols:
+            # one NaN-free float array, shared by hist and box
+            arr = df[c].to_numpy(dtype=np.float64, na_value=np.nan)
+            arr = arr[~np.isnan(arr)]
+            lo, hi = num_ranges.loc[c]
+            rng = None if np.isnan(lo) else (lo, hi)
+            jobs.append(ex.submit(plot_numeric, arr, c, rng))
+
+        # Character top-N bars
+        for c in char_freqs:
+            jobs.append(ex.submit(plot_top_n, char_freqs[c], c))
+
+        for job in jobs:
+            job.result()  # re-raise any plotting error here
+
+
+    # 7) Files saved list
+
+    print_header("FILES SAVED")
+    files = [ENRICHED_OUT, MISSING_OUT, NUMERIC_OUT, "missingness_bar.png"]
+    if SAVE_ENRICHED_CSV:
+        files.append(ENRICHED_CSV_OUT)
+    for c in num_cols:
+        files.append(f"hist_{c}.png")
+        files.append(f"box_{c}.png")
+    for c in char_freqs:
+        files.append(f"bar_{c}.png")
+
+    for f in files:
+        if os.path.exists(f):
+            print("- " + f + " (created)")
+        else:
+            print("- " + f + " (not found)")
 
-print_header("FILES SAVED")
-files = [ENRICHED_OUT, MISSING_OUT, NUMERIC_OUT, "missingness_bar.png"]
-for c in num_cols:
-    files.append(f"hist_{c}.png")
-    files.append(f"box_{c}.png")
-for c in char_freqs:
-    files.append(f"bar_{c}.png")
+    print("\nDone. Printed tables above; charts are PNGs in this folder.")
 
-for f in files:
-    if os.path.exists(f):
-        print("- " + f + " (created)")
-    else:
-        print("- " + f + " (not found)")
 
-print("\nDone. Printed tables above; charts are PNGs in this folder.")
+if __name__ == "__main__":
+    main()